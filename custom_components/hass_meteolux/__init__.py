@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses
-from datetime import timedelta
+from datetime import datetime, timedelta
 import logging
 from typing import Any
 
@@ -18,10 +19,13 @@ from homeassistant.const import (
     CONF_SCAN_INTERVAL,
     Platform,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.httpx_client
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_LANGUAGES, CORE_LANGUAGE, TEXT_CACHE_TTL
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,6 +45,47 @@ class ObservationData:
     visibility: float | None = None
 
 
+@dataclasses.dataclass
+class WeatherTexts:
+    """Language-dependent text layer of weather responses."""
+
+    fetched: datetime
+    icon_names: dict[int, str] = dataclasses.field(default_factory=dict)
+    vigilance_descriptions: dict[tuple[Any, ...], str] = dataclasses.field(
+        default_factory=dict
+    )
+
+    @staticmethod
+    def vigilance_key(vigilance: meteolux.models.Vigilance) -> tuple[Any, ...]:
+        """Return the language-independent identity of a vigilance."""
+        return (
+            vigilance.type,
+            vigilance.group,
+            vigilance.level,
+            vigilance.region,
+            vigilance.datetime_start,
+            vigilance.datetime_end,
+        )
+
+    def update(self, data: meteolux.models.WeatherResponse) -> None:
+        """Merge the texts of a weather response into this layer.
+
+        Icon names are static per language, so they accumulate across fetches.
+        Vigilance descriptions are replaced, as warnings come and go.
+        """
+        forecast = data.forecast
+        icons = [forecast.current.icon]
+        icons.extend(hfc.icon for hfc in forecast.hourly)
+        icons.extend(dfc.icon for dfc in forecast.daily)
+
+        self.fetched = dt_util.utcnow()
+        self.icon_names.update({icon.id: icon.name for icon in icons})
+        self.vigilance_descriptions = {
+            self.vigilance_key(vigilance): vigilance.description
+            for vigilance in data.vigilances
+        }
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up MeteoLux from a config entry."""
 
@@ -51,9 +96,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
@@ -72,6 +124,13 @@ class MeteoluxDataUpdateCoordinator(DataUpdateCoordinator):
         self.api_client = AsyncMeteoLuxClient(session=session)
         self.data: meteolux.models.WeatherResponse | None = None
         self.data_observation = ObservationData()
+        self.data_texts: dict[str, WeatherTexts] = {}
+        # Entries set up before languages existed get no condition sensors
+        self.languages: list[str] = config_entry.options.get(
+            CONF_LANGUAGES, config_entry.data.get(CONF_LANGUAGES, [])
+        )
+        self._requested_languages: set[str] = set()
+        self._text_locks: dict[str, asyncio.Lock] = {}
 
         self.scan_interval = SCAN_INTERVAL
 
@@ -105,13 +164,118 @@ class MeteoluxDataUpdateCoordinator(DataUpdateCoordinator):
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
         try:
-            return await self.api_client.get_weather(
-                langcode="en",
-                lat=self.config_entry.data.get(CONF_LATITUDE),
-                long=self.config_entry.data.get(CONF_LONGITUDE),
-            )
+            data = await self._async_get_weather(CORE_LANGUAGE)
         except MeteoLuxError as err:
             raise UpdateFailed(f"Error fetching MeteoLux data: {err}") from err
         except Exception as err:
             _LOGGER.exception("Unexpected error fetching MeteoLux data")
             raise UpdateFailed(f"Unexpected error: {err}") from err
+
+        # The core response carries the texts of its own language for free
+        self._update_texts(CORE_LANGUAGE, data)
+
+        # Other languages must not hold back the numeric core
+        for langcode in self._requested_languages - {CORE_LANGUAGE}:
+            self._async_schedule_texts(langcode, data)
+
+        return data
+
+    async def _async_get_weather(
+        self, langcode: str
+    ) -> meteolux.models.WeatherResponse:
+        """Fetch the weather of the configured location in the given language."""
+        return await self.api_client.get_weather(
+            langcode=langcode,
+            lat=self.config_entry.data.get(CONF_LATITUDE),
+            long=self.config_entry.data.get(CONF_LONGITUDE),
+        )
+
+    def _update_texts(
+        self, langcode: str, data: meteolux.models.WeatherResponse
+    ) -> None:
+        """Merge a weather response into the text layer of a language."""
+        self.data_texts.setdefault(
+            langcode, WeatherTexts(fetched=dt_util.utcnow())
+        ).update(data)
+
+    def _texts_outdated(
+        self, langcode: str, data: meteolux.models.WeatherResponse | None
+    ) -> bool:
+        """Return whether the text layer of a language needs to be fetched.
+
+        Besides the TTL, texts are outdated as soon as the core reports an icon
+        or a vigilance that is not yet known in that language.
+        """
+        texts = self.data_texts.get(langcode)
+
+        if texts is None or dt_util.utcnow() - texts.fetched >= TEXT_CACHE_TTL:
+            return True
+
+        if data is None:
+            return False
+
+        if data.forecast.current.icon.id not in texts.icon_names:
+            return True
+
+        return any(
+            texts.vigilance_key(vigilance) not in texts.vigilance_descriptions
+            for vigilance in data.vigilances
+        )
+
+    @callback
+    def async_request_language(self, langcode: str) -> None:
+        """Keep the text layer of a language up to date on subsequent updates.
+
+        Missing texts are fetched in the background, so that platform setup
+        does not wait on the network.
+        """
+        self._requested_languages.add(langcode)
+        self._async_schedule_texts(langcode, self.data)
+
+    @callback
+    def _async_schedule_texts(
+        self, langcode: str, data: meteolux.models.WeatherResponse | None
+    ) -> None:
+        """Fetch the texts of a language in the background if they are outdated."""
+        if self._texts_outdated(langcode, data):
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_request_texts(langcode, data),
+                f"{DOMAIN} texts {langcode}",
+            )
+
+    async def _async_request_texts(
+        self, langcode: str, data: meteolux.models.WeatherResponse | None
+    ) -> None:
+        """Fetch the texts of a language and notify entities."""
+        await self._async_update_texts(langcode, data)
+        self.async_update_listeners()
+
+    async def _async_update_texts(
+        self, langcode: str, data: meteolux.models.WeatherResponse | None
+    ) -> None:
+        """Fetch the text layer of a language if it is outdated.
+
+        The per-language lock keeps concurrent background requests from
+        fetching the same language twice.
+        """
+        async with self._text_locks.setdefault(langcode, asyncio.Lock()):
+            if self._texts_outdated(langcode, data):
+                await self._async_fetch_texts(langcode)
+
+    async def _async_fetch_texts(self, langcode: str) -> None:
+        """Fetch the text layer of a language.
+
+        A failed fetch keeps the previous texts rather than failing the
+        numeric core.
+        """
+        try:
+            data = await self._async_get_weather(langcode)
+        except MeteoLuxError as err:
+            _LOGGER.warning("Error fetching MeteoLux texts (%s): %s", langcode, err)
+            return
+        except Exception:
+            _LOGGER.exception("Unexpected error fetching MeteoLux texts (%s)", langcode)
+            return
+
+        self._update_texts(langcode, data)
@@ -8,11 +8,18 @@ from typing import Any
 from meteolux import AsyncMeteoLuxClient
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
+from homeassistant.core import callback
+import homeassistant.helpers.config_validation as cv
 import homeassistant.helpers.httpx_client
 
-from .const import DOMAIN
+from .const import CONF_LANGUAGES, CORE_LANGUAGE, DOMAIN, LANGUAGES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,6 +29,12 @@ class MeteoluxConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> MeteoluxOptionsFlow:
+        """Get the options flow for this handler."""
+        return MeteoluxOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -47,7 +60,10 @@ class MeteoluxConfigFlow(ConfigFlow, domain=DOMAIN):
                     {
                         vol.Required("city"): vol.All(
                             vol.Coerce(str), vol.In(places_for_form)
-                        )
+                        ),
+                        vol.Optional(
+                            CONF_LANGUAGES, default=[CORE_LANGUAGE]
+                        ): cv.multi_select(LANGUAGES),
                     }
                 ),
             )
@@ -63,5 +79,32 @@ class MeteoluxConfigFlow(ConfigFlow, domain=DOMAIN):
                 CONF_LATITUDE: city_lat,
                 CONF_LONGITUDE: city_long,
                 "city_id": city_id,
+                CONF_LANGUAGES: user_input.get(CONF_LANGUAGES, [CORE_LANGUAGE]),
             },
         )
+
+
+class MeteoluxOptionsFlow(OptionsFlow):
+    """Handle MeteoLux options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the forecast languages."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        languages = self.config_entry.options.get(
+            CONF_LANGUAGES, self.config_entry.data.get(CONF_LANGUAGES, [])
+        )
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(CONF_LANGUAGES, default=languages): cv.multi_select(
+                        LANGUAGES
+                    ),
+                }
+            ),
+        )
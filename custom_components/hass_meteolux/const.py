@@ -1,5 +1,7 @@
 """Constants for the MeteoLux integration."""
 
+from datetime import timedelta
+
 from homeassistant.components.weather import (
     ATTR_CONDITION_CLEAR_NIGHT,
     ATTR_CONDITION_CLOUDY,
@@ -21,6 +23,22 @@ ATTRIBUTION = "Data provided by Administration de la navigation aérienne / Mete
 MODEL = "MeteoLux API backend"
 MANUFACTURER = "Administration de la navigation aérienne"
 
+CONF_LANGUAGES = "languages"
+
+# Languages supported by the MeteoLux API
+LANGUAGES: dict[str, str] = {
+    "en": "English",
+    "fr": "Français",
+    "de": "Deutsch",
+    "lb": "Lëtzebuergesch",
+}
+
+# Language of the numeric forecast core, which is fetched on every update
+CORE_LANGUAGE = "en"
+
+# How long the text layer of an additional language is cached
+TEXT_CACHE_TTL = timedelta(hours=1)
+
 # Inspired by meteo_france integration
 CONDITION_CLASSES: dict[str, list[int]] = {
     ATTR_CONDITION_CLEAR_NIGHT: [0, 6, 7, 11, 16, 46],
@@ -20,12 +20,13 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import MeteoluxDataUpdateCoordinator
-from .const import ATTRIBUTION, DOMAIN, MANUFACTURER, MODEL
+from .const import ATTRIBUTION, DOMAIN, LANGUAGES, MANUFACTURER, MODEL
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -87,6 +88,23 @@ async def async_setup_entry(
     entities: list[MeteoLuxSensor[Any]] = [
         MeteoLuxSensor(coordinator, description) for description in SENSOR_TYPES
     ]
+    entities.extend(
+        MeteoLuxConditionSensor(coordinator, langcode)
+        for langcode in coordinator.languages
+    )
+
+    # Drop condition sensors of languages removed through the options flow
+    removed_suffixes = tuple(
+        f"_condition_{langcode}"
+        for langcode in LANGUAGES
+        if langcode not in coordinator.languages
+    )
+    entity_registry = er.async_get(hass)
+    for entity_entry in er.async_entries_for_config_entry(
+        entity_registry, config_entry.entry_id
+    ):
+        if entity_entry.unique_id.endswith(removed_suffixes):
+            entity_registry.async_remove(entity_entry.entity_id)
 
     async_add_entities(entities, False)
 
@@ -138,3 +156,75 @@ class MeteoLuxSensor(CoordinatorEntity[MeteoluxDataUpdateCoordinator], SensorEnt
             return float(value)
 
         return value
+
+
+class MeteoLuxConditionSensor(
+    CoordinatorEntity[MeteoluxDataUpdateCoordinator], SensorEntity
+):
+    """Representation of the current condition text in one language."""
+
+    _attr_attribution = ATTRIBUTION
+
+    def __init__(
+        self,
+        coordinator: MeteoluxDataUpdateCoordinator,
+        langcode: str,
+    ) -> None:
+        """Initialize the condition text sensor."""
+        super().__init__(coordinator)
+        self._langcode = langcode
+        city_name = self.coordinator.data.city.name
+        self._attr_name = f"{city_name} Condition ({LANGUAGES[langcode]})"
+        self._attr_unique_id = f"{self.coordinator.data.city.lat},{self.coordinator.data.city.long}_condition_{langcode}"
+
+    async def async_added_to_hass(self) -> None:
+        """Request the text layer of this language from the coordinator."""
+        await super().async_added_to_hass()
+        self.coordinator.async_request_language(self._langcode)
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info."""
+        assert self.platform.config_entry and self.platform.config_entry.unique_id
+        return DeviceInfo(
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, self.platform.config_entry.unique_id)},
+            manufacturer=MANUFACTURER,
+            model=MODEL,
+            name=self.coordinator.name,
+        )
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the condition text of the current icon."""
+        texts = self.coordinator.data_texts.get(self._langcode)
+        if texts is None:
+            return None
+
+        return texts.icon_names.get(self.coordinator.data.forecast.current.icon.id)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the current vigilances, described in this language."""
+        texts = self.coordinator.data_texts.get(self._langcode)
+        vigilances = []
+
+        for vigilance in self.coordinator.data.vigilances:
+            description = vigilance.description
+            if texts is not None:
+                description = texts.vigilance_descriptions.get(
+                    texts.vigilance_key(vigilance), description
+                )
+
+            vigilances.append(
+                {
+                    "level": vigilance.level,
+                    "type": vigilance.type,
+                    "region": vigilance.region,
+                    "start": vigilance.datetime_start.isoformat(),
+                    "end": vigilance.datetime_end.isoformat(),
+                    "description": description,
+                }
+            )
+
+        return {"vigilances": vigilances}